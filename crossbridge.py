@@ -21,10 +21,15 @@ import sys
 import asyncio
 import logging
 import json
+import re
+import socket
 from typing import Optional, TYPE_CHECKING, Any
 from dataclasses import dataclass
 from enum import Enum
 
+# Windows serial drivers report flow-control stalls as ERROR_SEM_TIMEOUT (WinError 121)
+_SEMAPHORE_TIMEOUT_RE = re.compile(r"semaphore timeout|winerror 121", re.IGNORECASE)
+
 class MissingDependencyError(ImportError):
     pass
 
@@ -89,10 +94,12 @@ class EventLoopRunner:
         self.logger = logging.getLogger(__name__)
         self.winloop_available = False
         self.uvloop_available = False
+        self._loop_run = None
         
         if sys.platform in ('win32', 'cygwin', 'cli'):
             try:
                 import winloop
+                self._loop_run = winloop.run
                 self.winloop_available = True
                 self.logger.debug("winloop available for Windows")
             except ImportError:
@@ -100,6 +107,7 @@ class EventLoopRunner:
         else:
             try:
                 import uvloop
+                self._loop_run = uvloop.run
                 self.uvloop_available = True
                 self.logger.debug("uvloop available for Unix/Linux")
             except ImportError:
@@ -109,9 +117,8 @@ class EventLoopRunner:
         if sys.platform in ('win32', 'cygwin', 'cli'):
             if self.winloop_available:
                 try:
-                    from winloop import run
                     self.logger.info("Using winloop for enhanced Windows performance")
-                    return run(main_coro)
+                    return self._loop_run(main_coro)
                 except Exception as e:
                     self.logger.debug(f"Failed to use winloop: {e}")
 
@@ -119,9 +126,8 @@ class EventLoopRunner:
         else:
             if self.uvloop_available:
                 try:
-                    from uvloop import run
                     self.logger.info("Using uvloop for enhanced Unix/Linux performance")
-                    return run(main_coro)
+                    return self._loop_run(main_coro)
                 except Exception as e:
                     self.logger.debug(f"Failed to use uvloop: {e}")
 
@@ -208,8 +214,10 @@ class TransportType(Enum):
 class BridgeConfig:
     bridge_config: PPPBridgeConfig
     buffer_size: int = 16384
+    socket_read_size: int = 65536
     read_timeout: float = 0.1
     write_timeout: float = 5.0
+    tcp_user_timeout: float = 60.0
     heartbeat_interval: float = 30.0
     connection_check_interval: float = 5.0
     max_concurrent_connections: int = 10
@@ -219,10 +227,14 @@ class BridgeConfig:
     def __post_init__(self):
         if self.buffer_size <= 0:
             raise ValueError("Buffer size must be positive")
+        if self.socket_read_size <= 0:
+            raise ValueError("Socket read size must be positive")
         if self.read_timeout <= 0:
             raise ValueError("Read timeout must be positive")
         if self.write_timeout <= 0:
             raise ValueError("Write timeout must be positive")
+        if self.tcp_user_timeout < 0:
+            raise ValueError("TCP user timeout must not be negative")
 
 class SocketTransport:
     def __init__(self, config: BridgeConfig):
@@ -243,6 +255,8 @@ class SocketTransport:
                 timeout=30.0
             )
             
+            self._tune_socket()
+            
             self.connected = True
             self.logger.info(f"Connected to {host}:{port}")
             
@@ -253,13 +267,35 @@ class SocketTransport:
         except Exception as e:
             raise RuntimeError(f"Failed to connect to {host}:{port}: {e}")
     
+    def _tune_socket(self) -> None:
+        sock = self.writer.get_extra_info('socket') if self.writer else None
+        if sock is None or sock.family not in (socket.AF_INET, socket.AF_INET6):
+            return
+
+        # PPP control frames are small; don't let Nagle hold them back
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError as e:
+            self.logger.debug(f"Failed to set TCP_NODELAY: {e}")
+
+        # Drop the connection if sent data stays unacknowledged this long (0 keeps the OS default)
+        if hasattr(socket, 'TCP_USER_TIMEOUT') and self.config.tcp_user_timeout:
+            try:
+                sock.setsockopt(
+                    socket.IPPROTO_TCP,
+                    socket.TCP_USER_TIMEOUT,
+                    int(self.config.tcp_user_timeout * 1000)
+                )
+            except (OSError, TypeError, ValueError) as e:
+                self.logger.debug(f"Failed to set TCP_USER_TIMEOUT: {e}")
+    
     async def read(self, size: int = -1) -> bytes:
         if not self.reader:
             raise RuntimeError("Transport not connected")
         
         try:
             if size == -1:
-                size = self.config.buffer_size
+                size = self.config.socket_read_size
             
             timeout = 0.1
             
@@ -296,9 +332,10 @@ class SocketTransport:
             
             chunk_size = 8192
             bytes_written = 0
+            view = memoryview(data)
             
             for i in range(0, len(data), chunk_size):
-                chunk = data[i:i + chunk_size]
+                chunk = view[i:i + chunk_size]
                 self.writer.write(chunk)
                 
                 try:
@@ -326,6 +363,99 @@ class SocketTransport:
             self.connected = False
             raise
     
+    async def authenticate(self, username: str, password: str) -> bool:
+        try:
+            auth_string = f"{username}:{password}\r\n".encode()
+            self.logger.debug(f"Sending authentication: {auth_string}")
+            await self.write(auth_string)
+            
+            await asyncio.sleep(0.5)
+            
+            try:
+                response = await asyncio.wait_for(
+                    self.read(1024),
+                    timeout=2.0
+                )
+                
+                self.logger.debug(f"Authentication response: {response}")
+                
+                if b"Authentication failed" in response:
+                    self.logger.error("Authentication failed")
+                    return False
+                    
+                self.logger.info("Authentication successful")
+                return True
+                    
+            except asyncio.TimeoutError:
+                self.logger.debug("Authentication timeout, assuming success")
+                return True
+            
+        except Exception as e:
+            self.logger.error(f"Authentication failed: {e}")
+            return False
+    
+    async def negotiate_speed(self, timeout: float = 10.0) -> Optional[tuple[str, str]]:
+        try:
+            self.logger.info("Waiting for speed negotiation ...")
+
+            loop = asyncio.get_event_loop()
+            deadline = loop.time() + timeout
+            buffer = b""
+            line = None
+            
+            while line is None and loop.time() < deadline:
+                try:
+                    data = await asyncio.wait_for(
+                        self.read(1024),
+                        timeout=1.0
+                    )
+                    
+                    if not data:
+                        if not self.connected:
+                            break
+                        continue
+                    
+                    self.logger.debug(f"Speed negotiation data: {data}")
+                    buffer += data
+                    
+                    # Only decode completed lines; a split line stays buffered until its newline
+                    end = buffer.find(b"\n")
+                    while end != -1 and line is None:
+                        candidate = buffer[:end].strip()
+                        buffer = buffer[end + 1:]
+                        start = candidate.find(b"NEGOTIATE:")
+                        if start != -1:
+                            line = candidate[start:]
+                        elif candidate.startswith(b"ERROR:"):
+                            self.logger.error(f"Speed negotiation rejected: {candidate.decode('utf-8', errors='ignore')}")
+                            return None
+                        end = buffer.find(b"\n")
+                
+                except asyncio.TimeoutError:
+                    continue
+                except Exception as e:
+                    self.logger.debug(f"Speed negotiation read error: {e}")
+                    continue
+            
+            if line is None:
+                # Servers that never terminate the line only get parsed once nothing more can arrive
+                start = buffer.find(b"NEGOTIATE:")
+                if start == -1:
+                    self.logger.error("Speed negotiation timeout")
+                    return None
+                line = buffer[start:].strip()
+            
+            parts = line.split(b":", 2)
+            speed = parts[1].strip().decode('utf-8', errors='ignore')
+            connection_type = parts[2].strip().decode('utf-8', errors='ignore') if len(parts) > 2 else "Unknown"
+            
+            self.logger.info(f"Received speed negotiation: {speed} bps ({connection_type})")
+            return speed, connection_type
+            
+        except Exception as e:
+            self.logger.error(f"Speed negotiation failed: {e}")
+            return None
+    
     async def close(self) -> None:
         if self.writer:
             try:
@@ -414,12 +544,18 @@ class PPPBridge:
                 self.bridge_config.server_port
             )
             
-            if not await self._authenticate_direct(socket_transport):
+            if not await socket_transport.authenticate(
+                self.bridge_config.username,
+                self.bridge_config.password
+            ):
                 return 1
             
-            if not await self._speed_negotiation_direct(socket_transport):
+            negotiated = await socket_transport.negotiate_speed()
+            if not negotiated:
                 return 1
             
+            speed, connection_type = negotiated
+            self.logger.info(f"Speed negotiation successful for direct bridge: {speed} bps ({connection_type})")
             self.logger.info("Direct bridge ready - starting PPP data bridging")
             
             await self._bridge_connections(serial_transport, socket_transport)
@@ -435,82 +571,6 @@ class PPPBridge:
             if 'socket_transport' in locals():
                 await socket_transport.close()
     
-    async def _authenticate_direct(self, socket_transport: SocketTransport) -> bool:
-        try:
-            auth_string = f"{self.bridge_config.username}:{self.bridge_config.password}\r\n".encode()
-            self.logger.debug(f"Sending authentication: {auth_string}")
-            await socket_transport.write(auth_string)
-            
-            await asyncio.sleep(0.5)
-            
-            try:
-                response = await asyncio.wait_for(
-                    socket_transport.read(1024),
-                    timeout=2.0
-                )
-                
-                self.logger.debug(f"Authentication response: {response}")
-                
-                if b"Authentication failed" in response:
-                    self.logger.error("Authentication failed")
-                    return False
-                    
-                self.logger.info("Authentication successful")
-                return True
-                    
-            except asyncio.TimeoutError:
-                self.logger.debug("Authentication timeout, assuming success")
-                return True
-            
-        except Exception as e:
-            self.logger.error(f"Direct bridge authentication failed: {e}")
-            return False
-    
-    async def _speed_negotiation_direct(self, socket_transport: SocketTransport) -> bool:
-        try:
-            self.logger.info("Waiting for speed negotiation ...")
-
-            start_time = asyncio.get_event_loop().time()
-            timeout = 10.0
-            
-            while (asyncio.get_event_loop().time() - start_time) < timeout:
-                try:
-                    data = await asyncio.wait_for(
-                        socket_transport.read(1024),
-                        timeout=1.0
-                    )
-                    
-                    if data:
-                        response = data.decode('utf-8', errors='ignore')
-                        self.logger.debug(f"Speed negotiation data: {response}")
-                        
-                        if "NEGOTIATE:" in response:
-                            lines = response.split('\n')
-                            for line in lines:
-                                if "NEGOTIATE:" in line:
-                                    parts = line.strip().split(":")
-                                    if len(parts) >= 2:
-                                        speed = parts[1].strip()
-                                        connection_type = parts[2].strip() if len(parts) > 2 else "Unknown"
-                                        
-                                        self.logger.info(f"Received speed negotiation: {speed} bps ({connection_type})")
-                                        self.logger.info(f"Speed negotiation successful for direct bridge: {speed} bps ({connection_type})")
-                                        
-                                        return True
-                
-                except asyncio.TimeoutError:
-                    continue
-                except Exception as e:
-                    self.logger.debug(f"Speed negotiation read error: {e}")
-                    continue
-            
-            self.logger.error("Speed negotiation timeout")
-            return False
-            
-        except Exception as e:
-            self.logger.error(f"Speed negotiation failed: {e}")
-            return False
-    
     async def _bridge_connections(self, serial_transport: SerialTransportProtocol, socket_transport: SocketTransport) -> None:
         try:
             serial_to_socket_task = asyncio.create_task(
@@ -541,75 +601,83 @@ class PPPBridge:
     async def _bridge_serial_to_socket(self, serial_transport: SerialTransportProtocol, socket_transport: SocketTransport) -> None:
         try:
             data_count = 0
-            no_data_count = 0
+            loop = asyncio.get_event_loop()
+            idle_since = loop.time()
+            idle_log_at = 300.0
             
             while self.running:
                 try:
                     data = await serial_transport.read()
                     if data:
                         data_count += 1
-                        no_data_count = 0
-                        self.logger.debug(f"Serial->Socket #{data_count}: {len(data)} bytes: {data[:20]}...")
+                        idle_since = loop.time()
+                        idle_log_at = 300.0
+                        self.logger.debug("Serial->Socket #%d: %d bytes: %s...", data_count, len(data), data[:20])
                         await socket_transport.write(data)
                     else:
-                        no_data_count += 1
-                        if no_data_count % 3000 == 0:
-                            self.logger.debug(f"No serial data for {no_data_count/1000:.1f} seconds")
-                        await asyncio.sleep(0.001)
+                        idle_time = loop.time() - idle_since
+                        if idle_time >= idle_log_at:
+                            self.logger.debug("No serial data for %.1f seconds", idle_time)
+                            idle_log_at += 300.0
                         
                 except Exception as e:
-                    if "semaphore timeout" in str(e).lower() or "winerror 121" in str(e).lower():
+                    if _SEMAPHORE_TIMEOUT_RE.search(str(e)):
                         self.logger.warning("Semaphore timeout detected, applying brief flow control...")
                         await asyncio.sleep(0.01)
                         continue
                     else:
-                        self.logger.error(f"Serial->Socket error: {e}")
+                        self.logger.error("Serial->Socket error: %s", e)
                         raise
                     
         except Exception as e:
-            self.logger.debug(f"Serial to socket bridge ended: {e}")
+            self.logger.debug("Serial to socket bridge ended: %s", e)
     
     async def _bridge_socket_to_serial(self, socket_transport: SocketTransport, serial_transport: SerialTransportProtocol) -> None:
         try:
             data_count = 0
-            no_data_count = 0
+            loop = asyncio.get_event_loop()
+            idle_since = loop.time()
+            idle_log_at = 100.0
             
             while self.running:
                 try:
                     data = await socket_transport.read()
                     if data:
                         data_count += 1
-                        no_data_count = 0
-                        self.logger.debug(f"Socket->Serial #{data_count}: {len(data)} bytes: {data[:20]}...")
+                        idle_since = loop.time()
+                        idle_log_at = 100.0
+                        self.logger.debug("Socket->Serial #%d: %d bytes: %s...", data_count, len(data), data[:20])
                         await serial_transport.write(data)
                     else:
                         if not await socket_transport.is_connected():
                             self.logger.info("Socket closed, ending bridge")
                             break
                         else:
-                            no_data_count += 1
-                            if no_data_count % 1000 == 0:
-                                self.logger.debug(f"No socket data for {no_data_count/1000:.1f} seconds")
-                            await asyncio.sleep(0.001)
+                            idle_time = loop.time() - idle_since
+                            if idle_time >= idle_log_at:
+                                self.logger.debug("No socket data for %.1f seconds", idle_time)
+                                idle_log_at += 100.0
                             
                 except Exception as e:
-                    if "semaphore timeout" in str(e).lower() or "winerror 121" in str(e).lower():
+                    if _SEMAPHORE_TIMEOUT_RE.search(str(e)):
                         self.logger.warning("Semaphore timeout detected, applying brief flow control...")
                         await asyncio.sleep(0.01)
                         continue
                     else:
-                        self.logger.error(f"Socket->Serial error: {e}")
+                        self.logger.error("Socket->Serial error: %s", e)
                         raise
                     
         except Exception as e:
-            self.logger.debug(f"Socket to serial bridge ended: {e}")
+            self.logger.debug("Socket to serial bridge ended: %s", e)
 
 def create_bridge_config(bridge_config: PPPBridgeConfig) -> BridgeConfig:
     return BridgeConfig(
         bridge_config=bridge_config,
         buffer_size=16384,
+        socket_read_size=65536,
         read_timeout=0.1,
         write_timeout=5.0,
+        tcp_user_timeout=60.0,
         heartbeat_interval=30.0,
         connection_check_interval=5.0,
         max_concurrent_connections=10,
@@ -22,6 +22,16 @@ from typing import Optional
 from dataclasses import dataclass
 
 from serial_utils import SerialTransport
+from crossbridge import SocketTransport, BridgeConfig, PPPBridgeConfig
+
+# Hayes numeric result codes sent instead of verbose responses after ATV0
+_NUMERIC_RESPONSES = {
+    "OK": "0\r",
+    "NO CARRIER": "3\r",
+    "ERROR": "4\r",
+    "NO DIALTONE": "6\r",
+    "BUSY": "7\r",
+}
 
 class SimpleCompression:
     def __init__(self):
@@ -66,10 +76,10 @@ class SimpleCompression:
             return data
         
         try:
-            if data[:2] == b'\x1b\x43':
-                compressed_data = data[2:]
+            if data.startswith(b'\x1b\x43'):
+                compressed_data = memoryview(data)[2:]
                 decompressed = zlib.decompress(compressed_data)
-                self.logger.debug(f"Decompressed {len(compressed_data)} -> {len(decompressed)} bytes")
+                self.logger.debug("Decompressed %d -> %d bytes", len(compressed_data), len(decompressed))
                 return decompressed
             else:
                 return data
@@ -350,21 +360,10 @@ class CommandProcessor:
             return False
     
     async def _send_response(self, serial_transport: SerialTransport, response: str) -> None:
-        if self.verbose_responses:
+        if self.verbose_responses or response not in _NUMERIC_RESPONSES:
             formatted_response = f"\r\n{response}\r\n"
         else:
-            if response == "OK":
-                formatted_response = "0\r"
-            elif response == "ERROR":
-                formatted_response = "4\r"
-            elif response == "NO CARRIER":
-                formatted_response = "3\r"
-            elif response == "BUSY":
-                formatted_response = "7\r"
-            elif response == "NO DIALTONE":
-                formatted_response = "6\r"
-            else:
-                formatted_response = f"\r\n{response}\r\n"
+            formatted_response = _NUMERIC_RESPONSES[response]
         
         await serial_transport.write(formatted_response.encode())
     
@@ -431,9 +430,15 @@ class S12Handler:
         return self.command_processor.get_escape_guard_time()
 
     def handle_data(self, chunk: bytes, now: float) -> tuple[bytes, bool]:
-        guard_time = self._guard_time_seconds()
         self.last_data_time = now
 
+        # Fast path: ordinary PPP data can neither start nor cancel an escape
+        if not self.pending and chunk != b'+++':
+            self.armed = False
+            return chunk, False
+
+        guard_time = self._guard_time_seconds()
+
         if guard_time == 0:
             self.armed = True
 
@@ -544,25 +549,26 @@ class ModemEmulator:
                 if self.connection_state.in_command_mode:
                     data = await serial_transport.read()
                     if not data:
-                        await asyncio.sleep(0.001)
                         continue
                     
                     command_buffer += data
                     
-                    while b'\r' in command_buffer or b'\n' in command_buffer:
-                        if b'\r' in command_buffer:
-                            cmd_bytes, command_buffer = command_buffer.split(b'\r', 1)
-                        else:
-                            cmd_bytes, command_buffer = command_buffer.split(b'\n', 1)
-                        
+                    # Split on CR, LF and CRLF in one pass; an unterminated tail stays buffered
+                    lines = command_buffer.splitlines(keepends=True)
+                    if lines and not lines[-1].endswith((b'\r', b'\n')):
+                        command_buffer = lines.pop()
+                    else:
+                        command_buffer = b""
+                    
+                    for cmd_bytes in lines:
                         command = self.command_processor.extract_command(cmd_bytes)
                         if command:
                             await self._process_command(command, serial_transport, server_host, server_port)
                 
                 elif self.connection_state.connected:
                     await self._bridge_ppp_data(serial_transport)
-                
-                await asyncio.sleep(0.001)
+                else:
+                    await asyncio.sleep(0.001)
                 
         except Exception as e:
             self.logger.error(f"Command processing loop error: {e}")
@@ -586,7 +592,7 @@ class ModemEmulator:
         try:
             self.logger.info("Hangup command received")
             
-            if hasattr(self.connection_state, 'socket_connection') and self.connection_state.socket_connection:
+            if self.connection_state.socket_connection:
                 await self.connection_state.socket_connection.close()
                 self.connection_state.socket_connection = None
             
@@ -601,8 +607,6 @@ class ModemEmulator:
     
     async def _handle_dial_command(self, command: str, serial_transport: SerialTransport, server_host: str, server_port: int) -> None:
         try:
-            from crossbridge import SocketTransport, BridgeConfig, PPPBridgeConfig
-            
             if command.startswith("ATDT"):
                 phone_number = command[4:].strip() if len(command) > 4 else ""
             elif command.startswith("ATD"):
@@ -630,7 +634,10 @@ class ModemEmulator:
             try:
                 await socket_transport.connect(server_host, server_port)
                 
-                if not await self._authenticate(socket_transport):
+                if not await socket_transport.authenticate(
+                    self.modem_config.username,
+                    self.modem_config.password
+                ):
                     await socket_transport.close()
                     await serial_transport.write(b"\r\nNO CARRIER\r\n")
                     return
@@ -656,37 +663,6 @@ class ModemEmulator:
         except Exception as e:
             self.logger.error(f"Dial command error: {e}")
 
-    async def _authenticate(self, socket_transport) -> bool:
-        try:
-            auth_string = f"{self.modem_config.username}:{self.modem_config.password}\r\n".encode()
-            self.logger.debug(f"Sending authentication: {auth_string}")
-            await socket_transport.write(auth_string)
-            
-            await asyncio.sleep(0.5)
-            
-            try:
-                response = await asyncio.wait_for(
-                    socket_transport.read(1024),
-                    timeout=2.0
-                )
-                
-                self.logger.debug(f"Authentication response: {response}")
-                
-                if b"Authentication failed" in response:
-                    self.logger.error("Authentication failed")
-                    return False
-                    
-                self.logger.info("Authentication successful")
-                return True
-                    
-            except asyncio.TimeoutError:
-                self.logger.debug("Authentication timeout, assuming success")
-                return True
-            
-        except Exception as e:
-            self.logger.error(f"Authentication failed: {e}")
-            return False
-    
     async def _send_connection_sequence(self, serial_transport: SerialTransport) -> None:
         try:
             if not self.is_windows:
@@ -732,52 +708,15 @@ class ModemEmulator:
         except Exception as e:
             self.logger.error(f"Connection sequence error: {e}")
     
-    async def _speed_negotiation(self, socket_transport) -> bool:
-        try:
-            self.logger.info("Waiting for speed negotiation ...")
-            
-            start_time = asyncio.get_event_loop().time()
-            timeout = 10.0
-            
-            while (asyncio.get_event_loop().time() - start_time) < timeout:
-                try:
-                    data = await asyncio.wait_for(
-                        socket_transport.read(1024),
-                        timeout=1.0
-                    )
-                    
-                    if data:
-                        response = data.decode('utf-8', errors='ignore')
-                        self.logger.debug(f"Speed negotiation data: {response}")
-                        
-                        if "NEGOTIATE:" in response:
-                            lines = response.split('\n')
-                            for line in lines:
-                                if "NEGOTIATE:" in line:
-                                    parts = line.strip().split(":")
-                                    if len(parts) >= 2:
-                                        speed = parts[1].strip()
-                                        connection_type = parts[2].strip() if len(parts) > 2 else "Unknown"
-                                        
-                                        self.logger.info(f"Received speed negotiation: {speed} bps ({connection_type})")
-                                        self.logger.info(f"Speed negotiation successful: {speed} bps ({connection_type})")
-                                        
-                                        self.logger.info(f"Dial successful - DTE: {self.modem_config.baud_rate}, DCE: {speed}, Negotiated: {speed} ({connection_type})")
-                                        
-                                        return True
-                
-                except asyncio.TimeoutError:
-                    continue
-                except Exception as e:
-                    self.logger.debug(f"Speed negotiation read error: {e}")
-                    continue
-            
-            self.logger.error("Speed negotiation timeout")
-            return False
-            
-        except Exception as e:
-            self.logger.error(f"Speed negotiation failed: {e}")
+    async def _speed_negotiation(self, socket_transport: SocketTransport) -> bool:
+        negotiated = await socket_transport.negotiate_speed()
+        if not negotiated:
             return False
+        
+        speed, connection_type = negotiated
+        self.logger.info(f"Speed negotiation successful: {speed} bps ({connection_type})")
+        self.logger.info(f"Dial successful - DTE: {self.modem_config.baud_rate}, DCE: {speed}, Negotiated: {speed} ({connection_type})")
+        return True
 
     async def _bridge_ppp_data(self, serial_transport: SerialTransport) -> None:
         try:
@@ -847,74 +786,94 @@ class ModemEmulator:
         try:
             self.logger.debug("Starting serial to socket bridge")
             data_count = 0
-            no_data_count = 0
             escape_detector = S12Handler(self.command_processor)
             loop = asyncio.get_event_loop()
+            idle_since = loop.time()
+            idle_warning_at = 300.0
             
             if self.command_processor.compression_enabled:
                 self.compression.enable_compression()
             
-            while self.connection_state.connected:
-                data = await serial_transport.read()
-                now = loop.time()
+            # Bind per-iteration callables once; this loop runs for every serial chunk
+            serial_read = serial_transport.read
+            socket_write = socket_transport.write
+            compress_data = self.compression.compress_data
+            handle_data = escape_detector.handle_data
+            handle_idle = escape_detector.handle_idle
+            loop_time = loop.time
+            state = self.connection_state
+            
+            while state.connected:
+                data = await serial_read()
+                now = loop_time()
                 if data:
                     data_count += 1
-                    no_data_count = 0
-                    processed_data, escape_triggered = escape_detector.handle_data(data, now)
+                    idle_since = now
+                    idle_warning_at = 300.0
+                    processed_data, escape_triggered = handle_data(data, now)
                     if escape_triggered:
                         self.logger.info("Escape sequence detected - entering command mode")
-                        self.connection_state.in_command_mode = True
-                        self.connection_state.connected = False
+                        state.in_command_mode = True
+                        state.connected = False
                         break
                     if not processed_data:
                         continue
-                    compressed_data = await self.compression.compress_data(processed_data)
+                    compressed_data = await compress_data(processed_data)
                     self.logger.debug(
-                        f"Serial->Socket #{data_count}: {len(processed_data)} bytes -> {len(compressed_data)} bytes: {processed_data[:20]}..."
+                        "Serial->Socket #%d: %d bytes -> %d bytes: %s...",
+                        data_count, len(processed_data), len(compressed_data), processed_data[:20]
                     )
-                    await socket_transport.write(compressed_data)
+                    await socket_write(compressed_data)
                 else:
-                    if escape_detector.handle_idle(now):
+                    if handle_idle(now):
                         self.logger.info("Escape sequence detected - entering command mode")
-                        self.connection_state.in_command_mode = True
-                        self.connection_state.connected = False
+                        state.in_command_mode = True
+                        state.connected = False
                         break
-                    no_data_count += 1
-                    if no_data_count % 3000 == 0:
-                        self.logger.warning(f"No serial data for {no_data_count/1000:.1f} seconds")
-                    await asyncio.sleep(0.001)
+                    idle_time = now - idle_since
+                    if idle_time >= idle_warning_at:
+                        self.logger.warning("No serial data for %.1f seconds", idle_time)
+                        idle_warning_at += 300.0
                     
         except Exception as e:
-            self.logger.error(f"Serial to socket bridge error: {e}")
+            self.logger.error("Serial to socket bridge error: %s", e)
             raise
     
     async def _bridge_socket_to_serial(self, socket_transport, serial_transport: SerialTransport) -> None:
         try:
             self.logger.debug("Starting socket to serial bridge")
             data_count = 0
-            no_data_count = 0
+            loop = asyncio.get_event_loop()
+            idle_since = loop.time()
+            idle_log_at = 100.0
+            
+            socket_read = socket_transport.read
+            serial_write = serial_transport.write
+            decompress_data = self.compression.decompress_data
+            state = self.connection_state
             
-            while self.connection_state.connected:
-                data = await socket_transport.read()
+            while state.connected:
+                data = await socket_read()
                 if data:
                     data_count += 1
-                    no_data_count = 0
+                    idle_since = loop.time()
+                    idle_log_at = 100.0
                     
-                    decompressed_data = await self.compression.decompress_data(data)
+                    decompressed_data = await decompress_data(data)
                     
-                    self.logger.debug(f"Socket->Serial #{data_count}: {len(data)} bytes -> {len(decompressed_data)} bytes: {data[:20]}...")
-                    await serial_transport.write(decompressed_data)
+                    self.logger.debug("Socket->Serial #%d: %d bytes -> %d bytes: %s...", data_count, len(data), len(decompressed_data), data[:20])
+                    await serial_write(decompressed_data)
                 else:
                     if not await socket_transport.is_connected():
                         self.logger.info("Socket closed, ending bridge")
-                        self.connection_state.connected = False
+                        state.connected = False
                         break
                     else:
-                        no_data_count += 1
-                        if no_data_count % 1000 == 0:
-                            self.logger.debug(f"No socket data for {no_data_count/1000:.1f} seconds")
-                        await asyncio.sleep(0.001)
+                        idle_time = loop.time() - idle_since
+                        if idle_time >= idle_log_at:
+                            self.logger.debug("No socket data for %.1f seconds", idle_time)
+                            idle_log_at += 100.0
                     
         except Exception as e:
-            self.logger.error(f"Socket to serial bridge error: {e}")
+            self.logger.error("Socket to serial bridge error: %s", e)
             raise
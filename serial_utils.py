@@ -15,13 +15,19 @@
 #   along with this program.  If not, see <https://www.gnu.org/licenses/>.
 ###
 import os
+import array
 import asyncio
+import collections
+import errno
+import functools
 import logging
+import queue
+import re
 import socket
-from typing import Optional
+import threading
+import time
+from typing import Optional, Protocol
 from dataclasses import dataclass
-from abc import ABC, abstractmethod
-from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 
 try:
@@ -29,12 +35,45 @@ try:
 except ImportError:
     pyserial = None
 
+try:
+    import fcntl
+    import termios
+except ImportError:
+    fcntl = None
+    termios = None
+
 class SerialConnectionType(Enum):
     PHYSICAL = "physical"
     UNIX_SOCKET = "unix_socket"
     TCP_SOCKET = "tcp_socket"
     NAMED_PIPE = "named_pipe"
 
+# ECONNRESET plus its Winsock spelling, which Windows reports as a raw errno
+_CONNECTION_RESET_ERRNOS = frozenset({errno.ECONNRESET, getattr(errno, 'WSAECONNRESET', 10054)})
+
+# pyserial's wording when a PTY's other end closes or a USB adapter is unplugged
+_DEVICE_GONE_RE = re.compile(r"device reports readiness|No such file or directory")
+
+_DEVICE_PREFIXES = (
+    ('unix:', SerialConnectionType.UNIX_SOCKET),
+    ('tcp:', SerialConnectionType.TCP_SOCKET),
+)
+
+class _CachedPathCheck:
+    # os.path.exists() for paths polled from the I/O threads; re-stats at most every `interval` seconds
+    def __init__(self, path: str, interval: float = 0.1):
+        self.path = path
+        self.interval = interval
+        self._exists = True
+        self._checked_until = 0.0
+    
+    def __call__(self) -> bool:
+        now = time.monotonic()
+        if now >= self._checked_until:
+            self._exists = os.path.exists(self.path)
+            self._checked_until = now + self.interval
+        return self._exists
+
 @dataclass
 class SerialConfig:
     device: str
@@ -43,128 +82,131 @@ class SerialConfig:
     write_timeout: float = 5.0
     connection_type: SerialConnectionType = SerialConnectionType.PHYSICAL
 
-class SerialConnectionInterface(ABC):
-    @abstractmethod
-    def read(self, size: int = 1) -> bytes:
-        pass
+class SerialConnectionInterface(Protocol):
+    def read(self, size: int = 1) -> bytes: ...
     
-    @abstractmethod
-    def write(self, data: bytes) -> int:
-        pass
+    def write(self, data: bytes) -> int: ...
     
-    @abstractmethod
-    def flush(self) -> None:
-        pass
+    def flush(self) -> None: ...
     
-    @abstractmethod
-    def close(self) -> None:
-        pass
+    def close(self) -> None: ...
     
-    @abstractmethod
-    def is_connected(self) -> bool:
-        pass
+    def is_connected(self) -> bool: ...
 
-class UnixSocketConnection(SerialConnectionInterface):
-    def __init__(self, socket_path: str, read_timeout: float = 0.1, write_timeout: float = 5.0):
-        self.socket_path = socket_path
+class SocketConnection:
+    # Stream socket standing in for a serial line; subclasses pick the address family
+    def __init__(self, family: int, address, name: str, endpoint: str, read_timeout: float = 0.1, write_timeout: float = 5.0):
+        self.family = family
+        self.address = address
+        self.name = name
+        self.endpoint = endpoint
         self.read_timeout = read_timeout
         self.write_timeout = write_timeout
         self.sock = None
         self.is_closed = False
         self.logger = logging.getLogger(__name__)
+        self._rx_buffer = bytearray()
+        self._rx_view = memoryview(self._rx_buffer)
         self._connect()
     
     def _connect(self):
         try:
-            if not os.path.exists(self.socket_path):
-                raise FileNotFoundError(f"Unix socket path does not exist: {self.socket_path}")
-            
-            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock = socket.socket(self.family, socket.SOCK_STREAM)
             self.sock.settimeout(self.read_timeout)
-            self.sock.connect(self.socket_path)
+            self.sock.connect(self.address)
+            self._configure_socket()
             self.is_closed = False
-            self.logger.info(f"Unix socket serial connection opened: {self.socket_path}")
+            self.logger.info("%s serial connection opened: %s", self.name, self.endpoint)
             
         except Exception as e:
             self.is_closed = True
-            raise ConnectionError(f"Unexpected error connecting to Unix socket: {e}")
+            raise ConnectionError(self._connect_error(e))
+    
+    def _configure_socket(self) -> None:
+        pass
+    
+    def _connect_error(self, e: Exception) -> str:
+        return f"Failed to connect to {self.name} {self.endpoint}: {e}"
+    
+    def _on_read_timeout(self) -> None:
+        pass
     
     def is_connected(self) -> bool:
-        if not self.sock or self.is_closed:
-            return False
-        
-        if not os.path.exists(self.socket_path):
-            self.logger.info("Unix socket file no longer exists")
-            self.close()
-            return False
-        
-        try:
-            self.sock.recv(1, socket.MSG_PEEK | socket.MSG_DONTWAIT)
-            return True
-        except socket.timeout:
-            return True
-        except socket.error as e:
-            if e.errno in (11, 35):
-                return True
-            elif e.errno in (32, 104):
-                self.logger.info(f"Unix socket connection broken: {e}")
-                self.close()
-                return False
-            else:
-                self.logger.debug(f"Unix socket health check warning: {e}")
-                return True
-        except Exception:
-            return True
+        # Broken connections are detected by read/write, which close the socket
+        return self.sock is not None and not self.is_closed
+    
+    def _recv(self, sock: socket.socket, size: int) -> bytes:
+        # Receive into a reusable buffer so only the returned bytes are allocated
+        if len(self._rx_buffer) < size:
+            self._rx_buffer = bytearray(size)
+            self._rx_view = memoryview(self._rx_buffer)
+        count = sock.recv_into(self._rx_view, size)
+        return bytes(self._rx_view[:count])
     
     def read(self, size: int = 1) -> bytes:
-        if not self.sock or self.is_closed:
+        # close() may clear self.sock from the other I/O thread; work on one reference
+        sock = self.sock
+        if sock is None or self.is_closed:
             return b""
         
         try:
-            data = self.sock.recv(size)
+            data = self._recv(sock, size)
             if not data:
-                self.logger.info("Unix socket connection closed by remote")
+                self.logger.info("%s connection closed by remote", self.name)
                 self.close()
                 return b""
             return data
+        except (BlockingIOError, InterruptedError):
+            return b""
         except socket.timeout:
-            if not os.path.exists(self.socket_path):
-                self.logger.info("Unix socket file removed, connection lost")
-                self.close()
-                return b""
+            self._on_read_timeout()
             return b""
         except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError) as e:
-            self.logger.info(f"Unix socket connection lost: {e}")
+            self.logger.info("%s connection lost: %s", self.name, e)
             self.close()
             return b""
-        except Exception as e:
-            self.logger.error(f"Unix socket read error: {e}")
+        except OSError as e:
+            if e.errno in _CONNECTION_RESET_ERRNOS:
+                self.logger.info("%s connection forcibly closed by remote host", self.name)
+            else:
+                self.logger.error("%s read error: %s", self.name, e)
             self.close()
             return b""
     
+    def _send_all(self, sock: socket.socket, data: bytes) -> None:
+        # The reader thread shares this socket, so keep its read timeout and
+        # retry timed-out sends until write_timeout instead of changing it
+        view = memoryview(data)
+        deadline = time.monotonic() + self.write_timeout
+        while view:
+            try:
+                sent = sock.send(view)
+            except socket.timeout:
+                if time.monotonic() >= deadline:
+                    raise
+                continue
+            view = view[sent:]
+    
     def write(self, data: bytes) -> int:
-        if not self.sock:
+        sock = self.sock
+        if sock is None:
             return 0
         
         try:
-            original_timeout = self.sock.gettimeout()
-            self.sock.settimeout(self.write_timeout)
-            
-            try:
-                bytes_sent = self.sock.send(data)
-                return bytes_sent
-            finally:
-                self.sock.settimeout(original_timeout)
-                
+            self._send_all(sock, data)
+            return len(data)
         except socket.timeout:
-            self.logger.warning(f"Unix socket write timeout after {self.write_timeout}s, continuing...")
+            self.logger.warning("%s write timeout after %ss, continuing...", self.name, self.write_timeout)
             return 0
         except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError) as e:
-            self.logger.info(f"Unix socket connection lost during write: {e}")
+            self.logger.info("%s connection lost during write: %s", self.name, e)
             self.close()
             return 0
-        except Exception as e:
-            self.logger.error(f"Unix socket write error: {e}")
+        except OSError as e:
+            if e.errno in _CONNECTION_RESET_ERRNOS:
+                self.logger.info("%s connection forcibly closed by remote host during write", self.name)
+            else:
+                self.logger.error("%s write error: %s", self.name, e)
             self.close()
             return 0
     
@@ -175,134 +217,53 @@ class UnixSocketConnection(SerialConnectionInterface):
         if self.sock and not self.is_closed:
             try:
                 self.sock.close()
-                self.logger.info("Unix socket serial connection closed")
+                self.logger.info("%s serial connection closed", self.name)
             except Exception as e:
-                self.logger.debug(f"Error closing Unix socket: {e}")
+                self.logger.debug("Error closing %s: %s", self.name, e)
             finally:
                 self.sock = None
                 self.is_closed = True
 
-class TCPSocketConnection(SerialConnectionInterface):
-    def __init__(self, host: str, port: int, read_timeout: float = 0.1, write_timeout: float = 5.0):
-        self.host = host
-        self.port = port
-        self.read_timeout = read_timeout
-        self.write_timeout = write_timeout
-        self.sock = None
-        self.is_closed = False
-        self.logger = logging.getLogger(__name__)
-        self._connect()
+class UnixSocketConnection(SocketConnection):
+    def __init__(self, socket_path: str, read_timeout: float = 0.1, write_timeout: float = 5.0):
+        self.socket_path = socket_path
+        self._path_exists = _CachedPathCheck(socket_path)
+        super().__init__(socket.AF_UNIX, socket_path, "Unix socket", socket_path, read_timeout, write_timeout)
     
-    def _connect(self):
-        try:
-            self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.sock.settimeout(self.read_timeout)
-            self.sock.connect((self.host, self.port))
-            self.is_closed = False
-            self.logger.info(f"TCP socket serial connection opened: {self.host}:{self.port}")
-            
-        except Exception as e:
-            self.is_closed = True
-            raise ConnectionError(f"Failed to connect to TCP socket {self.host}:{self.port}: {e}")
+    def _connect_error(self, e: Exception) -> str:
+        if isinstance(e, FileNotFoundError):
+            # connect() itself reports a missing socket file; no need to stat it first
+            return f"Unexpected error connecting to Unix socket: Unix socket path does not exist: {self.socket_path}"
+        return f"Unexpected error connecting to Unix socket: {e}"
+    
+    def _on_read_timeout(self) -> None:
+        if not self._path_exists():
+            self.logger.info("Unix socket file removed, connection lost")
+            self.close()
     
     def is_connected(self) -> bool:
-        if not self.sock or self.is_closed:
+        if not super().is_connected():
             return False
         
-        try:
-            self.sock.recv(1, socket.MSG_PEEK | socket.MSG_DONTWAIT)
-            return True
-        except socket.error as e:
-            if e.errno in (11, 35, 10035):
-                return True
-            elif e.errno == 10054:
-                self.logger.info("TCP socket connection reset by peer")
-                self.close()
-                return False
-            else:
-                self.logger.info(f"TCP socket connection health check failed: {e}")
-                self.close()
-                return False
-        except Exception:
-            return True
-
-    def read(self, size: int = 1) -> bytes:
-        if not self.sock:
-            return b""
-        
-        try:
-            data = self.sock.recv(size)
-            if not data:
-                self.logger.info("TCP socket connection closed by remote")
-                self.close()
-                return b""
-            return data
-        except socket.timeout:
-            return b""
-        except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError) as e:
-            self.logger.info(f"TCP socket connection lost: {e}")
-            self.close()
-            return b""
-        except OSError as e:
-            if e.errno == 10054:
-                self.logger.info("TCP socket connection forcibly closed by remote host")
-            else:
-                self.logger.info(f"TCP socket connection error: {e}")
-            self.close()
-            return b""
-        except Exception as e:
-            self.logger.error(f"TCP socket read error: {e}")
+        if not self._path_exists():
+            self.logger.info("Unix socket file no longer exists")
             self.close()
-            return b""
-    
-    def write(self, data: bytes) -> int:
-        if not self.sock:
-            return 0
+            return False
         
-        try:
-            original_timeout = self.sock.gettimeout()
-            self.sock.settimeout(self.write_timeout)
-            
-            try:
-                bytes_sent = self.sock.send(data)
-                return bytes_sent
-            finally:
-                self.sock.settimeout(original_timeout)
-                
-        except socket.timeout:
-            self.logger.warning(f"TCP socket write timeout after {self.write_timeout}s, continuing...")
-            return 0
-        except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError) as e:
-            self.logger.info(f"TCP socket connection lost during write: {e}")
-            self.close()
-            return 0
-        except OSError as e:
-            if e.errno == 10054:
-                self.logger.info("TCP socket connection forcibly closed by remote host during write")
-            else:
-                self.logger.info(f"TCP socket write error: {e}")
-            self.close()
-            return 0
-        except Exception as e:
-            self.logger.error(f"TCP socket write error: {e}")
-            self.close()
-            return 0
-    
-    def flush(self) -> None:
-        pass
+        return True
+
+class TCPSocketConnection(SocketConnection):
+    def __init__(self, host: str, port: int, read_timeout: float = 0.1, write_timeout: float = 5.0):
+        self.host = host
+        self.port = port
+        super().__init__(socket.AF_INET, (host, port), "TCP socket", f"{host}:{port}", read_timeout, write_timeout)
     
-    def close(self) -> None:
-        if self.sock and not self.is_closed:
-            try:
-                self.sock.close()
-                self.logger.info("TCP socket serial connection closed")
-            except Exception as e:
-                self.logger.debug(f"Error closing TCP socket: {e}")
-            finally:
-                self.sock = None
-                self.is_closed = True
+    def _configure_socket(self) -> None:
+        # PPP frames are small and latency-sensitive; keepalive catches a vanished emulator
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
 
-class PhysicalSerialConnection(SerialConnectionInterface):
+class PhysicalSerialConnection:
     def __init__(self, device: str, baud_rate: int = 38400, read_timeout: float = 0.1, write_timeout: float = 5.0):
         self.device = device
         self.baud_rate = baud_rate
@@ -310,6 +271,9 @@ class PhysicalSerialConnection(SerialConnectionInterface):
         self.write_timeout = write_timeout
         self.serial_port = None
         self.logger = logging.getLogger(__name__)
+        self._device_exists = _CachedPathCheck(device)
+        self._inq_buffer = None
+        self._fd = -1
         self._connect()
     
     def _connect(self):
@@ -323,47 +287,39 @@ class PhysicalSerialConnection(SerialConnectionInterface):
                 timeout=self.read_timeout,
                 write_timeout=self.write_timeout
             )
-            self.logger.info(f"Physical serial connection opened: {self.device}")
+            if fcntl and hasattr(termios, 'TIOCINQ'):
+                self._fd = self.serial_port.fileno()
+                self._inq_buffer = array.array('i', [0])
+            self.logger.info("Physical serial connection opened: %s", self.device)
             
         except Exception as e:
             raise ConnectionError(f"Failed to open serial port {self.device}: {e}")
     
+    def _in_waiting(self) -> int:
+        # On POSIX ask the tty driver directly rather than going through pyserial's property
+        if self._inq_buffer is not None:
+            fcntl.ioctl(self._fd, termios.TIOCINQ, self._inq_buffer, True)
+            return self._inq_buffer[0]
+        return self.serial_port.in_waiting
+    
     def read(self, size: int = 1) -> bytes:
         if not self.serial_port or not self.serial_port.is_open:
             return b""
         
         try:
-            if hasattr(self.serial_port, 'in_waiting'):
-                if self.serial_port.in_waiting == 0:
-                    data = self.serial_port.read(0)
-                    if data is None:
-                        self.logger.info("Physical serial device disconnected (PTY closed)")
-                        self.close()
-                        return b""
-            
-            data = self.serial_port.read(size)
-            
-            if not data and size > 0:
-                try:
-                    _ = self.serial_port.is_open
-                    if hasattr(self.serial_port, 'in_waiting'):
-                        _ = self.serial_port.in_waiting
-                except (OSError, AttributeError) as e:
-                    self.logger.info(f"Physical serial device disconnected: {e}")
-                    self.close()
-                    return b""
-            
-            return data
+            # pyserial waits for all `size` bytes or the timeout, so ask only for
+            # what is buffered, or one byte to block until the next arrives
+            return self.serial_port.read(min(size, self._in_waiting()) or 1)
             
         except (OSError, AttributeError) as e:
-            if "device reports readiness" in str(e) or "No such file or directory" in str(e):
-                self.logger.info(f"Physical serial device disconnected (PTY closed): {e}")
+            if _DEVICE_GONE_RE.search(str(e)):
+                self.logger.info("Physical serial device disconnected (PTY closed): %s", e)
             else:
-                self.logger.error(f"Serial read error: {e}")
+                self.logger.error("Serial read error: %s", e)
             self.close()
             return b""
         except Exception as e:
-            self.logger.error(f"Serial read error: {e}")
+            self.logger.error("Serial read error: %s", e)
             self.close()
             return b""
     
@@ -371,22 +327,19 @@ class PhysicalSerialConnection(SerialConnectionInterface):
         if not self.serial_port:
             return 0
         
-        original_timeout = self.serial_port.timeout
+        # write_timeout was given to pyserial at open; leave the reader's timeout alone
         try:
-            self.serial_port.timeout = self.write_timeout
             return self.serial_port.write(data)
         except Exception as e:
-            self.logger.error(f"Serial write error: {e}")
+            self.logger.error("Serial write error: %s", e)
             return 0
-        finally:
-            self.serial_port.timeout = original_timeout
     
     def flush(self) -> None:
         if self.serial_port:
             try:
                 self.serial_port.flush()
             except Exception as e:
-                self.logger.error(f"Serial flush error: {e}")
+                self.logger.error("Serial flush error: %s", e)
     
     def close(self) -> None:
         if self.serial_port:
@@ -394,7 +347,7 @@ class PhysicalSerialConnection(SerialConnectionInterface):
                 self.serial_port.close()
                 self.logger.info("Physical serial connection closed")
             except Exception as e:
-                self.logger.debug(f"Error closing serial port: {e}")
+                self.logger.debug("Error closing serial port: %s", e)
             finally:
                 self.serial_port = None
     
@@ -406,36 +359,32 @@ class PhysicalSerialConnection(SerialConnectionInterface):
             if not self.serial_port.is_open:
                 return False
             
-            if hasattr(self.serial_port, 'port') and self.serial_port.port:
-                if self.serial_port.port.startswith('/dev/tty'):
-                    if not os.path.exists(self.serial_port.port):
-                        self.logger.info(f"PTY device file no longer exists: {self.serial_port.port}")
-                        self.close()
-                        return False
+            if self.device.startswith('/dev/tty') and not self._device_exists():
+                self.logger.info("PTY device file no longer exists: %s", self.device)
+                self.close()
+                return False
             
             try:
-                _ = self.serial_port.in_waiting
+                self._in_waiting()
                 return True
             except (OSError, AttributeError):
                 self.close()
                 return False
                 
         except Exception as e:
-            self.logger.debug(f"Serial connection check failed: {e}")
+            self.logger.debug("Serial connection check failed: %s", e)
             self.close()
             return False
 
 class SerialConnectionFactory:
     @staticmethod
+    @functools.lru_cache(maxsize=32)
     def detect_connection_type(device: str) -> SerialConnectionType:
-        if device.startswith('unix:'):
-            return SerialConnectionType.UNIX_SOCKET
-        elif device.startswith('tcp:'):
-            return SerialConnectionType.TCP_SOCKET
-        elif device.startswith('COM') or device.startswith('/dev/'):
-            return SerialConnectionType.PHYSICAL
-        else:
-            return SerialConnectionType.PHYSICAL
+        for prefix, connection_type in _DEVICE_PREFIXES:
+            if device.startswith(prefix):
+                return connection_type
+        # COM ports, /dev/ nodes and anything unrecognised are opened with pyserial
+        return SerialConnectionType.PHYSICAL
     
     @staticmethod
     def create_connection(config: SerialConfig) -> SerialConnectionInterface:
@@ -458,31 +407,30 @@ class SerialConnectionFactory:
             raise ValueError(f"Unsupported connection type: {config.connection_type}")
 
 class SerialTransport:
+    FLUSH_EVERY = 16
+    
     def __init__(self, buffer_size: int = 16384, read_timeout: float = 0.1, write_timeout: float = 5.0):
         self.buffer_size = buffer_size
         self.read_timeout = read_timeout
         self.write_timeout = write_timeout
         self.serial_connection: Optional[SerialConnectionInterface] = None
-        self.read_queue: asyncio.Queue = asyncio.Queue()
-        self.write_queue: asyncio.Queue = asyncio.Queue()
+        self.read_buffer: collections.deque = collections.deque()
+        self._read_ready = asyncio.Event()
+        self.write_queue: queue.SimpleQueue = queue.SimpleQueue()
         self.connected = False
         self.logger = logging.getLogger(__name__)
-        self._read_task: Optional[asyncio.Task] = None
-        self._write_task: Optional[asyncio.Task] = None
-        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._read_thread: Optional[threading.Thread] = None
+        self._write_thread: Optional[threading.Thread] = None
     
     async def connect(self, device: str, baud_rate: int = 38400) -> None:
         try:
-            self.logger.info(f"Connecting to serial device {device}")
+            self.logger.info("Connecting to serial device %s", device)
             
             loop = asyncio.get_event_loop()
-            connection_type = await loop.run_in_executor(
-                self._executor,
-                SerialConnectionFactory.detect_connection_type,
-                device
-            )
+            connection_type = SerialConnectionFactory.detect_connection_type(device)
             
-            self.logger.info(f"Detected connection type: {connection_type}")
+            self.logger.info("Detected connection type: %s", connection_type)
             
             serial_config = SerialConfig(
                 device=device,
@@ -493,179 +441,213 @@ class SerialTransport:
             )
             
             self.serial_connection = await loop.run_in_executor(
-                self._executor,
+                None,
                 SerialConnectionFactory.create_connection,
                 serial_config
             )
             
             self.connected = True
+            self._loop = loop
             
-            self._read_task = asyncio.create_task(self._serial_read_loop())
-            self._write_task = asyncio.create_task(self._serial_write_loop())
+            # Blocking I/O runs on dedicated threads; only the read queue hand-off touches the loop
+            self._read_thread = threading.Thread(
+                target=self._serial_read_loop,
+                args=(self.serial_connection,),
+                name="serial-read",
+                daemon=True
+            )
+            self._write_thread = threading.Thread(
+                target=self._serial_write_loop,
+                args=(self.serial_connection,),
+                name="serial-write",
+                daemon=True
+            )
+            self._read_thread.start()
+            self._write_thread.start()
             
-            self.logger.info(f"Connected to serial device {device}")
+            self.logger.info("Connected to serial device %s", device)
             
         except Exception as e:
-            self.logger.error(f"Serial connection failed: {e}")
+            self.logger.error("Serial connection failed: %s", e)
             raise
     
-    async def _serial_read_loop(self) -> None:
+    def _enqueue_read(self, data: bytes) -> None:
+        # Runs on the event loop; the reader thread schedules it via call_soon_threadsafe
+        self.read_buffer.append(data)
+        self._read_ready.set()
+    
+    def _serial_read_loop(self, connection: SerialConnectionInterface) -> None:
         try:
-            loop = asyncio.get_event_loop()
+            deliver = self._loop.call_soon_threadsafe
+            enqueue = self._enqueue_read
             consecutive_empty_reads = 0
             
-            while self.connected and self.serial_connection:
+            while self.connected:
                 try:
-                    if not self.serial_connection.is_connected():
+                    if not connection.is_connected():
                         self.logger.info("Serial connection lost, stopping read loop")
                         self.connected = False
                         break
                     
-                    data = await loop.run_in_executor(
-                        self._executor,
-                        self.serial_connection.read,
-                        self.buffer_size
-                    )
+                    data = connection.read(self.buffer_size)
                     
                     if data:
-                        await self.read_queue.put(data)
+                        try:
+                            deliver(enqueue, data)
+                        except RuntimeError:
+                            # The event loop is already closed; nobody is left to read this
+                            break
                         consecutive_empty_reads = 0
                     else:
                         consecutive_empty_reads += 1
                         
                         if consecutive_empty_reads >= 10:
-                            if not self.serial_connection.is_connected():
+                            if not connection.is_connected():
                                 self.logger.info("Serial device disconnected (empty reads), stopping read loop")
                                 self.connected = False
                                 break
                             consecutive_empty_reads = 0
                         
-                        await asyncio.sleep(0.01)
-                        
                 except Exception as e:
-                    self.logger.error(f"Serial read error: {e}")
+                    self.logger.error("Serial read error: %s", e)
                     self.connected = False
                     break
                     
-        except asyncio.CancelledError:
-            self.logger.debug("Serial read loop cancelled")
         except Exception as e:
-            self.logger.error(f"Serial read loop error: {e}")
+            self.logger.error("Serial read loop error: %s", e)
             self.connected = False
     
-    async def _serial_write_loop(self) -> None:
+    def _serial_write_loop(self, connection: SerialConnectionInterface) -> None:
         try:
-            loop = asyncio.get_event_loop()
+            get = self.write_queue.get
+            get_nowait = self.write_queue.get_nowait
+            queue_empty = self.write_queue.empty
+            stopping = False
+            unflushed = 0
             
-            while self.connected and self.serial_connection:
+            while self.connected and not stopping:
                 try:
-                    if not self.serial_connection.is_connected():
-                        self.logger.info("Serial connection lost, stopping write loop")
-                        self.connected = False
+                    try:
+                        data = get(timeout=1.0)
+                    except queue.Empty:
+                        continue
+                    
+                    if data is None:
                         break
                     
-                    data = await asyncio.wait_for(
-                        self.write_queue.get(),
-                        timeout=1.0
-                    )
+                    # Coalesce anything else already queued into one write and one flush
+                    chunks = [data]
+                    pending = len(data)
+                    while pending < self.buffer_size:
+                        try:
+                            chunk = get_nowait()
+                        except queue.Empty:
+                            break
+                        if chunk is None:
+                            stopping = True
+                            break
+                        chunks.append(chunk)
+                        pending += len(chunk)
+                    if len(chunks) > 1:
+                        data = b"".join(chunks)
                     
-                    bytes_written = await loop.run_in_executor(
-                        self._executor,
-                        self.serial_connection.write,
-                        data
-                    )
+                    bytes_written = connection.write(data)
                     
                     if bytes_written == 0 and len(data) > 0:
-                        if not self.serial_connection.is_connected():
+                        if not connection.is_connected():
                             self.logger.info("Serial write failed, connection lost")
                             self.connected = False
                             break
                         else:
                             self.logger.warning("Serial write timeout, but connection still active")
                     
-                    await loop.run_in_executor(
-                        self._executor,
-                        self.serial_connection.flush
-                    )
+                    # Flushing waits for the UART to drain, so defer it while more writes are queued
+                    unflushed += 1
+                    if unflushed >= self.FLUSH_EVERY or queue_empty():
+                        connection.flush()
+                        unflushed = 0
                     
-                except asyncio.TimeoutError:
-                    continue
                 except Exception as e:
-                    self.logger.error(f"Serial write error: {e}")
+                    self.logger.error("Serial write error: %s", e)
                     self.connected = False
                     break
+            
+            if unflushed and connection.is_connected():
+                connection.flush()
                     
-        except asyncio.CancelledError:
-            self.logger.debug("Serial write loop cancelled")
         except Exception as e:
-            self.logger.error(f"Serial write loop error: {e}")
+            self.logger.error("Serial write loop error: %s", e)
             self.connected = False
     
+    def _join_threads(self) -> None:
+        if self._read_thread:
+            self._read_thread.join(timeout=self.read_timeout + 1.0)
+        if self._write_thread:
+            self._write_thread.join(timeout=self.write_timeout)
+    
     async def read(self, size: int = -1) -> bytes:
         if not self.connected:
             raise RuntimeError("Serial transport not connected")
         
+        read_buffer = self.read_buffer
         try:
-            data = await asyncio.wait_for(
-                self.read_queue.get(),
-                timeout=self.read_timeout
-            )
-            return data
+            if not read_buffer:
+                self._read_ready.clear()
+                await asyncio.wait_for(
+                    self._read_ready.wait(),
+                    timeout=self.read_timeout
+                )
+                if not read_buffer:
+                    return b""
+            
+            data = read_buffer.popleft()
+            
+            # Drain whatever else the reader has queued so a burst costs one await
+            chunks = [data]
+            total = len(data)
+            while (size < 0 or total < size) and read_buffer:
+                chunk = read_buffer.popleft()
+                chunks.append(chunk)
+                total += len(chunk)
+            
+            if size >= 0 and total > size:
+                # Push the bytes past size back; the next read returns them first
+                excess = total - size
+                read_buffer.appendleft(chunks[-1][-excess:])
+                chunks[-1] = chunks[-1][:-excess]
+            return b"".join(chunks)
             
         except asyncio.TimeoutError:
             return b""
         except Exception as e:
-            self.logger.error(f"Serial read error: {e}")
+            self.logger.error("Serial read error: %s", e)
             raise
     
     async def write(self, data: bytes) -> int:
         if not self.connected:
             raise RuntimeError("Serial transport not connected")
         
-        try:
-            await asyncio.wait_for(
-                self.write_queue.put(data),
-                timeout=self.write_timeout
-            )
-            return len(data)
-            
-        except asyncio.TimeoutError:
-            raise TimeoutError("Serial write timeout")
-        except Exception as e:
-            self.logger.error(f"Serial write error: {e}")
-            raise
+        self.write_queue.put(data)
+        return len(data)
     
     async def close(self) -> None:
         self.connected = False
+        self.write_queue.put(None)
         
-        if self._read_task:
-            self._read_task.cancel()
-            try:
-                await self._read_task
-            except asyncio.CancelledError:
-                pass
-        
-        if self._write_task:
-            self._write_task.cancel()
-            try:
-                await self._write_task
-            except asyncio.CancelledError:
-                pass
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, self._join_threads)
         
         if self.serial_connection:
             try:
-                loop = asyncio.get_event_loop()
                 await loop.run_in_executor(
-                    self._executor,
+                    None,
                     self.serial_connection.close
                 )
             except Exception as e:
-                self.logger.debug(f"Error closing serial connection: {e}")
+                self.logger.debug("Error closing serial connection: %s", e)
             finally:
                 self.serial_connection = None
         
-        self._executor.shutdown(wait=False)
-        
         self.logger.info("Serial transport closed")
     
     async def is_connected(self) -> bool:
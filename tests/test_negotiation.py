@@ -0,0 +1,55 @@
+import asyncio
+import unittest
+
+from crossbridge import BridgeConfig, PPPBridgeConfig, SocketTransport
+
+
+def make_transport(chunks, close_when_drained=True):
+    # Hands out the given chunks one read at a time, then reports the remote as closed
+    transport = SocketTransport(BridgeConfig(PPPBridgeConfig("user", "pass", "127.0.0.1", 6060, "/dev/null")))
+    transport.connected = True
+    pending = list(chunks)
+    
+    async def read(size=-1):
+        if pending:
+            return pending.pop(0)
+        if close_when_drained:
+            transport.connected = False
+        else:
+            await asyncio.sleep(0.01)
+        return b""
+    
+    transport.read = read
+    return transport
+
+
+class SpeedNegotiationTest(unittest.IsolatedAsyncioTestCase):
+    async def test_line_split_across_reads(self):
+        transport = make_transport([b"WELCOME\r\nNEGOTIATE:56", b"000:V.90\r\n"], close_when_drained=False)
+        self.assertEqual(await transport.negotiate_speed(timeout=1.0), ("56000", "V.90"))
+    
+    async def test_missing_connection_type(self):
+        transport = make_transport([b"NEGOTIATE:33600\n"], close_when_drained=False)
+        self.assertEqual(await transport.negotiate_speed(timeout=1.0), ("33600", "Unknown"))
+    
+    async def test_error_line_fails_fast(self):
+        transport = make_transport([b"ERROR:busy\n"], close_when_drained=False)
+        result = await asyncio.wait_for(transport.negotiate_speed(timeout=5.0), timeout=1.0)
+        self.assertIsNone(result)
+    
+    async def test_unterminated_line_parsed_at_deadline(self):
+        transport = make_transport([b"NEGOTIATE:28800:V.34"], close_when_drained=False)
+        self.assertEqual(await transport.negotiate_speed(timeout=0.2), ("28800", "V.34"))
+    
+    async def test_unterminated_line_parsed_on_close(self):
+        transport = make_transport([b"NEGOTIATE:28800:V.34"])
+        result = await asyncio.wait_for(transport.negotiate_speed(timeout=5.0), timeout=1.0)
+        self.assertEqual(result, ("28800", "V.34"))
+    
+    async def test_timeout_without_negotiation(self):
+        transport = make_transport([b"hello\n"], close_when_drained=False)
+        self.assertIsNone(await transport.negotiate_speed(timeout=0.2))
+
+
+if __name__ == "__main__":
+    unittest.main()